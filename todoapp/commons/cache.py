@@ -0,0 +1,60 @@
+import functools
+import time
+from collections.abc import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from commons import constants as common_constants
+
+
+def is_cache_shared() -> bool:
+    """
+    Util to check whether the cache is shared by all the processes.
+    Without Redis each process has its own local memory cache, which cannot be invalidated from other processes.
+
+    Returns:
+        bool: True if the cache is shared by all the processes.
+    """
+
+    return bool(settings.REDIS_URL)
+
+
+def clear_cached_utils() -> None:
+    """
+    Util to discard the cached results of all the utils by moving to a new cache generation.
+    Inside a transaction the results are discarded after commit, so that they are not cached again
+    from the data being replaced. A cache failure is logged instead of failing the committed write.
+    """
+
+    transaction.on_commit(
+        lambda: cache.set(common_constants.UTILS_CACHE_GENERATION_KEY, time.time_ns(), timeout=None),
+        robust=True,
+    )
+
+
+def cached_util(util: Callable) -> Callable:
+    """
+    Decorator to cache the result of a util for 'UTILS_CACHE_TIMEOUT' seconds.
+    Results are cached per arguments under the current cache generation, see 'clear_cached_utils'.
+
+    Args:
+        util (Callable): Util returning a picklable result.
+
+    Returns:
+        Callable: Util returning the cached result.
+    """
+
+    @functools.wraps(util)
+    def wrapper(*args, **kwargs):
+        generation = cache.get_or_set(common_constants.UTILS_CACHE_GENERATION_KEY, time.time_ns, timeout=None)
+        key = common_constants.UTILS_CACHE_KEY.format(
+            util_name=util.__name__,
+            arguments=':'.join([*map(str, args), *(f'{name}={value}' for name, value in sorted(kwargs.items()))]),
+        )
+        return cache.get_or_set(
+            key, lambda: util(*args, **kwargs), timeout=common_constants.UTILS_CACHE_TIMEOUT, version=generation
+        )
+
+    return wrapper
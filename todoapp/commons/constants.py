@@ -1 +1,6 @@
 NAME_MAX_LENGTH = 150
+
+# Cache of the report utils, all the cached results are discarded by changing the generation.
+UTILS_CACHE_KEY = 'utils:{util_name}:{arguments}'
+UTILS_CACHE_GENERATION_KEY = 'utils:generation'
+UTILS_CACHE_TIMEOUT = 60
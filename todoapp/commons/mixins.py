@@ -1,19 +1,62 @@
+import copy
+
 from rest_framework import serializers
 
 
 class SerializerToActionMapperMixin:
     """
-    Mixin for mapping serializer to request actions. 
+    Mixin for mapping serializer to request actions.
     """
 
     serializer_classes = NotImplemented
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Method to bind the serializer class lookup once when the view class is defined.
+        """
+
+        super().__init_subclass__(**kwargs)
+        if cls.serializer_classes is not NotImplemented:
+            cls._get_serializer_class_for_action = cls.serializer_classes.get
+
     def get_serializer_class(self) -> serializers.Serializer:
         """
         Method to get serializer class based on request action.
+        Falls back to 'serializer_class' of the view for actions which are not mapped.
 
         Returns:
             serializers.Serializer: Serializer class based on request action.
         """
 
-        return self.serializer_classes[self.action]
+        return self._get_serializer_class_for_action(self.action) or super().get_serializer_class()
+
+
+class CachedFieldsSerializerMixin:
+    """
+    Mixin for building the fields of a serializer once per serializer class.
+    Only for serializers whose fields do not depend on the instance, data or context.
+    """
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Method to reset the cached fields for each serializer class.
+        """
+
+        super().__init_subclass__(**kwargs)
+        cls._cached_fields = None
+
+    def get_fields(self) -> dict:
+        """
+        Method to get the fields of the serializer.
+        Fields are built by the serializer on first call and deep copied from the cache afterwards,
+        which skips the model introspection done by ModelSerializer.
+
+        Returns:
+            dict: Field name mapped to an unbound field instance.
+        """
+
+        cls = type(self)
+        if cls._cached_fields is None:
+            cls._cached_fields = super().get_fields()
+
+        return copy.deepcopy(cls._cached_fields)
@@ -1,9 +1,11 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination
 
 
-class CustomPagination(PageNumberPagination):
+class CustomPagination(CursorPagination):
     """
     Generic Pagination class.
+    Uses keyset pagination on the primary key which avoids counting all the rows for each page.
     """
 
     page_size = 10
+    ordering = '-id'
@@ -3,6 +3,10 @@ MAX_LENGTH = 10
 MAX_ASSOCIATED_PROJECTS = 2
 NO_SPACE_LEFT = 0
 
+# Cache for membership of the requesting user in a project, timeout is in seconds.
+PROJECT_MEMBER_CACHE_KEY = 'project_member:{user_id}:{project_id}'
+PROJECT_MEMBER_CACHE_TIMEOUT = 60
+
 ERROR_MESSAGES = {
     'ALREADY_MEMBER_OF_PROJECT': 'User is already a member',
     'MAX_ASSOCIATED_PROJECTS_LIMIT': 'Cannot add as user is already a member in two projects',
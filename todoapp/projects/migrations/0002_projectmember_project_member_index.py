@@ -0,0 +1,19 @@
+# Generated by Django 5.0.4 on 2026-10-15 08:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='projectmember',
+            index=models.Index(fields=['project', 'member'], name='projects_pr_project_655b37_idx'),
+        ),
+    ]
@@ -44,6 +44,7 @@ class ProjectMember(models.Model):
         project (ForeignKey to Project model)
         member (ForeignKey to User model)
         project and member are unique together.
+        project and member are indexed together for lookups starting from the project.
     """
     
     project = models.ForeignKey(Project, on_delete=models.CASCADE)
@@ -51,6 +52,8 @@ class ProjectMember(models.Model):
 
     class Meta:
         unique_together = ('member', 'project')
+        # Unique constraint on (member, project) already serves lookups starting from the member.
+        indexes = [models.Index(fields=['project', 'member'])]
     
     def __str__(self) -> str:
         """
@@ -1,15 +1,36 @@
+from collections import abc
+from dataclasses import dataclass
+
 from django.contrib.auth import get_user_model
-from django.db.models import Count
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, Exists, OuterRef, Q
 from rest_framework import (
     exceptions as rest_exceptions,
     serializers as rest_serializers,
 )
 
+from commons import cache as common_cache
 from projects import (
     constants as project_constants,
     models as project_models,
 )
-from todos import serializers as todo_serializers
+
+User = get_user_model()
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectContext:
+    """
+    Project data required for adding and removing members.
+
+    Fields:
+        id (Project id)
+        max_members (Maximum members allowed in the project)
+    """
+
+    id: int
+    max_members: int
 
 
 class ProjectMemberSerializer(rest_serializers.Serializer):
@@ -27,7 +48,7 @@ class ProjectMemberSerializer(rest_serializers.Serializer):
     def validate_user_ids(self, user_ids: list) -> list:
         """
         Field level validation for 'user_ids'.
-        Remove duplicate ids present in the field.  
+        Remove duplicate ids present in the field while keeping the order of their first occurrence.
 
         Args:
             user_ids (list): User ids.
@@ -36,47 +57,114 @@ class ProjectMemberSerializer(rest_serializers.Serializer):
             list: User ids.
         """
 
-        return list(set(user_ids))
+        return list(dict.fromkeys(user_ids))
 
-    def get_user_wise_project_count_and_valid_user_ids(self) -> tuple:
+    def get_user_wise_project_stats(self, project: ProjectContext) -> dict:
         """
-        Method to get user wise project count and user ids of valid users.
+        Method to get project stats of the valid users present in request data in a single query.
+
+        Args:
+            project (ProjectContext): Project data.
+
+        Returns:
+            dict: User id mapped to a tuple of count of projects the user is a member of and
+                count of memberships of the user in the given project (0 or 1).
+        """
+
+        return {
+            user_id: (project_count, project_membership_count)
+            for user_id, project_count, project_membership_count in (
+                User.objects
+                .filter(id__in=self.validated_data['user_ids'])
+                # Only the id column of users is required, other columns are never selected.
+                .values('id')
+                .annotate(
+                    project_count=Count('projectmember'),
+                    project_membership_count=Count('projectmember', filter=Q(projectmember__project_id=project.id)),
+                )
+                .values_list('id', 'project_count', 'project_membership_count')
+            )
+        }
+
+    def get_user_wise_project_membership(self, project: ProjectContext) -> dict:
+        """
+        Method to get the membership in the given project of the valid users present in request data
+        in a single query. Other memberships of the users are not read.
+
+        Args:
+            project (ProjectContext): Project data.
 
         Returns:
-            tuple: dict containing user wise project count, set containing ids of valid users.
+            dict: User id mapped to True if the user is a member of the project, else False.
         """
 
-        user_wise_project_count = dict(
-            get_user_model().objects
+        return dict(
+            User.objects
             .filter(id__in=self.validated_data['user_ids'])
-            .annotate(project_count=Count('project'))
-            .prefetch_related('project_set')
-            .values_list('id', 'project_count')
+            .annotate(
+                is_project_member=Exists(
+                    project_models.ProjectMember.objects.filter(project_id=project.id, member_id=OuterRef('id'))
+                )
+            )
+            .values_list('id', 'is_project_member')
         )
 
-        return user_wise_project_count, set(user_wise_project_count.keys())
-
-    def check_for_invalid_user_ids(self, valid_user_ids: set) -> None:
+    def check_for_invalid_user_ids(self, valid_user_ids: abc.Set) -> None:
         """
         Method to check for invalid user ids.
 
         Args:
-            valid_user_ids (set): Valid user ids.
+            valid_user_ids (abc.Set): Valid user ids, any hash backed set like keys of a dict.
 
         Raises:
             ValidationError: When any of the user id in the request data is invalid.
         """
 
         # Invalid user ids present in request data.
-        if set(self.validated_data['user_ids']).difference(valid_user_ids):
+        if any(user_id not in valid_user_ids for user_id in self.validated_data['user_ids']):
             raise rest_exceptions.ValidationError({'user_ids': [project_constants.ERROR_MESSAGES['INVALID_USER_IDS']]})
 
-    def add_members(self, project: dict) -> dict:
+    def _add_members_within_limit(self, project: ProjectContext, user_ids: list) -> set:
+        """
+        Method to add users in a project, in the given order, till the max members limit of the project is reached.
+        Existing members are counted and the users are inserted in a single query.
+        The project row must be locked by the caller so that the member count does not change concurrently.
+        Rows inserted with raw SQL send no 'post_save' signal, hence the cached utils are discarded here.
+
+        Args:
+            project (ProjectContext): Project data.
+            user_ids (list): Ids of users to be added.
+
+        Returns:
+            set: Ids of users added in the project.
+        """
+
+        project_member_table = project_models.ProjectMember._meta.db_table
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {project_member_table} (project_id, member_id) '
+                'SELECT %s, candidate.member_id '
+                'FROM unnest(%s::bigint[]) WITH ORDINALITY AS candidate(member_id, position) '
+                'ORDER BY candidate.position '
+                f'LIMIT GREATEST(%s - (SELECT COUNT(*) FROM {project_member_table} WHERE project_id = %s), %s) '
+                'ON CONFLICT DO NOTHING '
+                'RETURNING member_id',
+                [project.id, user_ids, project.max_members, project.id, project_constants.NO_SPACE_LEFT],
+            )
+            added_user_ids = {member_id for member_id, in cursor.fetchall()}
+
+        if added_user_ids:
+            common_cache.clear_cached_utils()
+
+        return added_user_ids
+
+    def add_members(self, project: ProjectContext) -> dict:
         """
         Method to add members in a project.
 
         Args:
-            project (dict): Project data.
+            project (ProjectContext): Project data.
 
         Returns:
             dict: Containing logs for each user_id.
@@ -84,150 +172,80 @@ class ProjectMemberSerializer(rest_serializers.Serializer):
 
         logs = {}
         users_to_be_added = []
-        project_max_limit_reached = False
-        user_wise_project_count, valid_user_ids = self.get_user_wise_project_count_and_valid_user_ids()
+        user_wise_project_stats = self.get_user_wise_project_stats(project)
 
-        self.check_for_invalid_user_ids(valid_user_ids)
+        self.check_for_invalid_user_ids(user_wise_project_stats.keys())
 
-        for user_id in valid_user_ids:
+        # Invalid user ids are rejected above, hence every user id in request data has its stats.
+        for user_id in self.validated_data['user_ids']:
+            project_count, project_membership_count = user_wise_project_stats[user_id]
             # User is already a member of the project.
-            if user_id in project['users']:
+            if project_membership_count:
                 logs[user_id] = project_constants.ERROR_MESSAGES['ALREADY_MEMBER_OF_PROJECT']
             # User is already part of 2 projects.
-            elif user_wise_project_count[user_id] >= project_constants.MAX_ASSOCIATED_PROJECTS:
+            elif project_count >= project_constants.MAX_ASSOCIATED_PROJECTS:
                 logs[user_id] = project_constants.ERROR_MESSAGES['MAX_ASSOCIATED_PROJECTS_LIMIT']
             # User can be added in the project if max limit is not reached.
             else:
-                users_to_be_added.append(project_models.ProjectMember(project_id=project['id'], member_id=user_id))
+                users_to_be_added.append(user_id)
                 logs[user_id] = project_constants.SUCCESS_MESSAGES['MEMBER_ADDED_SUCCESSFULLY']
 
-        # Maximum member limit reached for the project
-        if project["existing_members"] + len(users_to_be_added) > project["max_members"]:
-            project_max_limit_reached = True
-            message = project_constants.ERROR_MESSAGES["PROJECT_MEMBERS_MAX_LIMIT_REACHED"].format(
-                remaining_members=project_constants.NO_SPACE_LEFT
-                if project["existing_members"] >= project["max_members"]
-                else project["max_members"] - project["existing_members"]
-            )
-            for project_member in users_to_be_added:
-                logs[project_member.member_id] = message
+        if users_to_be_added:
+            added_user_ids = self._add_members_within_limit(project, users_to_be_added)
 
-        if not project_max_limit_reached and users_to_be_added:
-            project_models.ProjectMember.objects.bulk_create(users_to_be_added)
+            # Maximum member limit reached for the project, users beyond the remaining slots are not added.
+            if len(added_user_ids) < len(users_to_be_added):
+                message = project_constants.ERROR_MESSAGES['PROJECT_MEMBERS_MAX_LIMIT_REACHED'].format(
+                    remaining_members=project_constants.NO_SPACE_LEFT
+                )
+                for user_id in users_to_be_added:
+                    if user_id not in added_user_ids:
+                        logs[user_id] = message
 
         return {'logs': logs}
 
-    def remove_members(self, project: dict) -> dict:
+    def remove_members(self, project: ProjectContext) -> dict:
         """
         Method to remove members from a project.
 
         Args:
-            project (dict): Project data.
+            project (ProjectContext): Project data.
 
         Returns:
             dict: Containing logs for each user_id.
         """
 
         logs = {}
-        _, valid_user_ids = self.get_user_wise_project_count_and_valid_user_ids()
         users_to_remove = []
+        user_wise_project_membership = self.get_user_wise_project_membership(project)
 
-        self.check_for_invalid_user_ids(valid_user_ids)
+        self.check_for_invalid_user_ids(user_wise_project_membership.keys())
 
-        for user_id in valid_user_ids:
+        for user_id in self.validated_data['user_ids']:
             # User is a member of the project.
-            if user_id in project['users']:
+            if user_wise_project_membership[user_id]:
                 logs[user_id] = project_constants.SUCCESS_MESSAGES['MEMBER_REMOVED_SUCCESSFULLY']
                 users_to_remove.append(user_id)
             else:
                 logs[user_id] = project_constants.ERROR_MESSAGES['NOT_A_MEMBER_OF_PROJECT']
 
         if users_to_remove:
-            project_models.ProjectMember.objects.filter(project_id=project['id'], member_id__in=users_to_remove).delete()
+            # Rows are deleted with a single DELETE query skipping the collector, which would fetch the rows and
+            # send a 'post_delete' signal for each of them, hence the cached utils are discarded once here.
+            project_members = project_models.ProjectMember.objects.filter(
+                project_id=project.id, member_id__in=users_to_remove
+            )
+            project_members._raw_delete(project_members.db)
+            common_cache.clear_cached_utils()
+            # Removed users should not be able to access the project through their cached membership.
+            if common_cache.is_cache_shared():
+                cache.delete_many([
+                    project_constants.PROJECT_MEMBER_CACHE_KEY.format(user_id=user_id, project_id=project.id)
+                    for user_id in users_to_remove
+                ])
 
         return {'logs': logs}
 
     class Meta:
         fields = ('user_ids',)
 
-
-class BaseProjectSerializer(rest_serializers.ModelSerializer):
-    """
-    Base Project Serializer
-    """
-
-    class Meta:
-        model = project_models.Project
-        fields = ('max_members',)
-
-
-class ProjectSerializer(BaseProjectSerializer):
-    """
-    Get all Projects serializer.
-    For all projects list with count of existing members.
-    """
-
-    status = rest_serializers.SerializerMethodField()
-    existing_member_count = rest_serializers.IntegerField()
-
-    def get_status(self, obj):
-        """
-        Get status of the project.
-
-        Args:
-            obj (Project): Project model instance
-
-        Returns:
-            str: Display value for the status field.
-        """
-
-        return obj.get_status_display()
-    
-    class Meta(BaseProjectSerializer.Meta):
-        fields = BaseProjectSerializer.Meta.fields + ('id', 'name', 'status', 'existing_member_count')
-
-
-class ProjectDetailSerializer(BaseProjectSerializer):
-    """
-    Project Detail Serializer.
-    """
-
-    project_name = rest_serializers.CharField(source='name')
-    done = rest_serializers.SerializerMethodField()
-
-    def get_done(self, obj: project_models.Project) -> str:
-        """
-        Function to populate done field.
-
-        Args:
-            obj (Project): Project Model instance.
-
-        Returns:
-            str: True if status is 2 i.e. completed else False.
-        """
-
-        return True if obj['status'] == project_models.Project.COMPLETED else False
-    
-    class Meta(BaseProjectSerializer.Meta):
-        fields = BaseProjectSerializer.Meta.fields + ('project_name', 'done')
-
-
-class ReportSerializer(todo_serializers.CreatorSerializer):
-    """
-    Report Serializer.
-    """
-
-    completed_count = rest_serializers.IntegerField()
-    pending_count = rest_serializers.IntegerField()
-
-    class Meta(todo_serializers.CreatorSerializer.Meta):
-        fields = todo_serializers.CreatorSerializer.Meta.fields + ('completed_count', 'pending_count')
-
-
-class ProjectWiseReportSerializer(rest_serializers.Serializer):
-    """
-    Project Wise Report Serializer.
-    """
-
-    project_title = rest_serializers.CharField(source='name')
-    report = ReportSerializer(many=True)
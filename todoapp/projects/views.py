@@ -1,12 +1,15 @@
-from django.contrib.postgres.aggregates.general import ArrayAgg
-from django.db.models import Count
+from django.core.cache import cache
+from django.db import transaction
+from django.http import Http404
 from rest_framework import (
     decorators as rest_decorators,
     response as rest_response,
     viewsets as rest_viewsets,
 )
 
+from commons import cache as common_cache
 from projects import (
+    constants as project_constants,
     models as project_models,
     serializers as project_serializers,
 )
@@ -35,20 +38,62 @@ class ProjectMemberApiViewSet(rest_viewsets.GenericViewSet):
 
     serializer_class = project_serializers.ProjectMemberSerializer
     lookup_url_kwarg = 'project_id'
+    lookup_value_regex = '[0-9]+'
 
     def get_queryset(self):
         """
         Method to get the queryset for the view set.
+        While adding members, the project row is locked till the end of the transaction so that
+        concurrent requests cannot exceed the max members limit of the project.
         """
 
-        return (
-            project_models.Project.objects
-            .annotate(existing_members=Count('projectmember__id'))
-            .annotate(users=ArrayAgg('projectmember__member__id'))
-            .filter(projectmember__member__id=self.request.user.id)
-            .values('id', 'existing_members', 'max_members', 'users')
+        queryset = project_models.Project.objects.values('id', 'max_members')
+        if self.action == 'add_members_to_project':
+            queryset = queryset.select_for_update()
+
+        return queryset
+
+    def check_project_membership(self) -> None:
+        """
+        Method to check whether the requesting user is a member of the project.
+        Membership is cached for a short duration to avoid querying it on every request, only when the cache
+        is shared so that removing a member discards the cached membership for all the processes.
+
+        Raises:
+            Http404: When the requesting user is not a member of the project.
+        """
+
+        # Ids like '05' are normalized so that the key matches the one discarded while removing members.
+        project_id = int(self.kwargs[self.lookup_url_kwarg])
+        cache_key = project_constants.PROJECT_MEMBER_CACHE_KEY.format(
+            user_id=self.request.user.id, project_id=project_id
         )
 
+        is_cache_shared = common_cache.is_cache_shared()
+        if is_cache_shared and cache.get(cache_key):
+            return
+
+        if not project_models.ProjectMember.objects.filter(
+            project_id=project_id, member_id=self.request.user.id
+        ).exists():
+            raise Http404
+
+        if is_cache_shared:
+            cache.set(cache_key, True, timeout=project_constants.PROJECT_MEMBER_CACHE_TIMEOUT)
+
+    def get_object(self) -> project_serializers.ProjectContext:
+        """
+        Method to get the project data for the request.
+        Only a member of the project can access it.
+
+        Returns:
+            ProjectContext: Project data.
+        """
+
+        self.check_project_membership()
+
+        return project_serializers.ProjectContext(**super().get_object())
+
     @rest_decorators.action(methods=['patch'], detail=True, url_path='add-members', url_name='add-members')
     def add_members_to_project(self, request, *args, **kwargs) -> rest_response.Response:
         """
@@ -61,10 +106,12 @@ class ProjectMemberApiViewSet(rest_viewsets.GenericViewSet):
             Response: Response containing information for each user id provided in request data.
         """
 
-        project = self.get_object()
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        logs = serializer.add_members(project)
+
+        with transaction.atomic():
+            project = self.get_object()
+            logs = serializer.add_members(project)
 
         return rest_response.Response(logs)
 
@@ -96,22 +96,56 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD'),  # Add user password if exists.
         'HOST': os.environ.get('DB_HOST'),          # Set to empty string for localhost..
         'PORT': os.environ.get('DB_PORT'),          # Psql service running port.
+        'CONN_MAX_AGE': 60,                         # Reuse connections across requests for up to 60 seconds.
+        'CONN_HEALTH_CHECKS': True,                 # Check reused connections before a request uses them.
+    }
+}
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/ref/settings/#caches
+
+REDIS_URL = os.environ.get('REDIS_URL')    # Redis url, e.g. redis://127.0.0.1:6379.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    } if REDIS_URL else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
 
 # Django Rest Framework
 
 REST_FRAMEWORK = {
+    # Tokens are cached only in Redis, as discarding them from the local memory cache of a process
+    # does not discard them from the caches of the other processes.
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework.authentication.TokenAuthentication',
+        'users.authentication.CachedTokenAuthentication' if REDIS_URL
+        else 'rest_framework.authentication.TokenAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'commons.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'TEST_REQUEST_DEFAULT_FORMAT': 'json',
 }
 
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.0/topics/auth/passwords/#using-argon2-with-django
+
+PASSWORD_HASHERS = [
+    'users.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class TodosConfig(AppConfig):
     name = 'todos'
     verbose_name = 'Todos Application'
+
+    def ready(self) -> None:
+        """
+        Method to connect the signal receivers of the app.
+        """
+
+        from todos import signals  # noqa: F401
@@ -2,6 +2,18 @@ DONE_STATUS = 'Done'
 TODO_STATUS = 'To Do'
 
 DATE_TIME_FORMAT = '%H:%M %p, %d %b, %Y'
+# Postgres TO_CHAR equivalent of DATE_TIME_FORMAT.
+POSTGRES_DATE_TIME_FORMAT = 'HH24:MI AM, DD Mon, YYYY'
 DATE_FORMAT = '%d-%m-%Y'
 
 NAME_MAX_LENGTH = 255
+
+# Default window and chunk size for fetching rows of unbounded tables.
+DEFAULT_OFFSET = 0
+DEFAULT_LIMIT = 1000
+ITERATOR_CHUNK_SIZE = 2000
+
+# Fields read by the cached report utils, saving any other field keeps the cached results.
+UTILS_USER_FIELDS = frozenset({'first_name', 'last_name', 'email'})
+UTILS_TODO_FIELDS = frozenset({'user', 'user_id', 'done'})
+UTILS_PROJECT_FIELDS = frozenset({'name', 'status', 'max_members'})
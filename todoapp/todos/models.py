@@ -19,6 +19,10 @@ class Todo(models.Model):
     done = models.BooleanField(default=False)
     date_created = models.DateTimeField(auto_now_add=True)
     date_completed = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        # Todo stats of users are grouped by user and filtered on done.
+        indexes = [models.Index(fields=['user', 'done'], name='todo_user_done_idx')]
     
     def __str__(self) -> str:
         """
@@ -1,6 +1,3 @@
-from collections import OrderedDict
-
-from django.contrib.auth import get_user_model
 from django.utils import timezone
 from rest_framework import serializers
 
@@ -41,17 +38,17 @@ class UpdateTodoSerializer(BaseTodoSerializer):
     done = serializers.BooleanField()
     todo = serializers.CharField(max_length=todo_constants.NAME_MAX_LENGTH, write_only=True, source='name')
     
-    def validate(self, attrs: OrderedDict) -> dict:
+    def validate(self, attrs: dict) -> dict:
         """
         Method to validate request data.
         Update 'date_created' field based on the value 'done' field i.e.
         set date_created to current date time if done = True.
 
         Args:
-            attrs (OrderedDict): Request data.
+            attrs (dict): Request data.
 
         Returns:
-            OrderedDict: Request data.
+            dict: Request data.
         """
 
         if attrs.get('done') is True:
@@ -60,58 +57,28 @@ class UpdateTodoSerializer(BaseTodoSerializer):
             attrs['date_completed'] = None
         return attrs
 
-    class Meta(BaseTodoSerializer.Meta):
-        fields = BaseTodoSerializer.Meta.fields + ('todo', 'date_completed')
-        extra_kwargs = {**BaseTodoSerializer.Meta.extra_kwargs, 'date_completed': {'write_only': True}}
-
-
-class CreatorSerializer(serializers.ModelSerializer):
-    """
-    Creator serializer for 'creator' field.
-    """
-
-    class Meta:
-        model = get_user_model()
-        fields = ('first_name', 'last_name', 'email')
-
-
-class TodoSerializer(serializers.ModelSerializer):
-    """
-    Todo Serializer.
-    """
-
-    status = serializers.SerializerMethodField()
-    created_at = serializers.SerializerMethodField()
-    creator = CreatorSerializer(source='user')
-
-    def get_status(self, obj):
+    def update(self, instance: todo_models.Todo, validated_data: dict) -> todo_models.Todo:
         """
-        Function to populate the status field.
+        Method to update the todo.
+        Only the changed fields are saved, hence renaming a todo keeps the cached results of the utils.
 
         Args:
-            obj (Todo): Todo model instance.
+            instance (Todo): Todo to be updated.
+            validated_data (dict): Validated request data.
 
         Returns:
-            str: Display value for status.
+            Todo: Updated todo.
         """
 
-        return todo_constants.DONE_STATUS if obj.done else todo_constants.TODO_STATUS
-
-    class Meta:
-        model = todo_models.Todo
-        fields = ('id', 'name', 'status', 'created_at', 'creator')
-
-
-    def get_created_at(self, obj):
-        """
-        Function to populate the created_at field.
-        Converts datetime object into "5:30 PM, 13 Dec, 2021" datetime string.
+        update_fields = [field for field, value in validated_data.items() if getattr(instance, field) != value]
+        for field in update_fields:
+            setattr(instance, field, validated_data[field])
+        if update_fields:
+            instance.save(update_fields=update_fields)
 
-        Args:
-            obj (Todo): Todo model instance.
+        return instance
 
-        Returns:
-            str: Display value for created_at.
-        """
+    class Meta(BaseTodoSerializer.Meta):
+        fields = BaseTodoSerializer.Meta.fields + ('todo', 'date_completed')
+        extra_kwargs = {**BaseTodoSerializer.Meta.extra_kwargs, 'date_completed': {'write_only': True}}
 
-        return obj.date_created.strftime(todo_constants.DATE_TIME_FORMAT)
@@ -0,0 +1,91 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from commons import cache as common_cache
+from projects import models as project_models
+from todos import (
+    constants as todo_constants,
+    models as todo_models,
+)
+
+
+def _are_utils_fields_saved(created: bool, update_fields: frozenset, utils_fields: frozenset) -> bool:
+    """
+    Function to check whether a save may change the fields read by the cached utils.
+
+    Args:
+        created (bool): True if the instance was created.
+        update_fields (frozenset): Fields passed to 'save', None when all the fields are saved.
+        utils_fields (frozenset): Fields of the model read by the cached utils.
+
+    Returns:
+        bool: True if the cached results of the utils may be stale.
+    """
+
+    return created or update_fields is None or not utils_fields.isdisjoint(update_fields)
+
+
+@receiver(post_save, sender=get_user_model())
+def clear_cached_utils_on_user_save(sender, instance, created: bool, update_fields: frozenset, **kwargs) -> None:
+    """
+    Receiver to discard the cached results of the utils when the name or email of a user is saved.
+    Saving only 'last_login' on login keeps the cached results.
+
+    Args:
+        sender (Model): User model.
+        instance (CustomUser): Saved user.
+        created (bool): True if the user is created.
+        update_fields (frozenset): Fields passed to 'save', None when all the fields are saved.
+    """
+
+    if _are_utils_fields_saved(created, update_fields, todo_constants.UTILS_USER_FIELDS):
+        common_cache.clear_cached_utils()
+
+
+@receiver(post_save, sender=todo_models.Todo)
+def clear_cached_utils_on_todo_save(sender, instance, created: bool, update_fields: frozenset, **kwargs) -> None:
+    """
+    Receiver to discard the cached results of the utils when a todo is created or its status is saved.
+
+    Args:
+        sender (Model): Todo model.
+        instance (Todo): Saved todo.
+        created (bool): True if the todo is created.
+        update_fields (frozenset): Fields passed to 'save', None when all the fields are saved.
+    """
+
+    if _are_utils_fields_saved(created, update_fields, todo_constants.UTILS_TODO_FIELDS):
+        common_cache.clear_cached_utils()
+
+
+@receiver(post_save, sender=project_models.Project)
+def clear_cached_utils_on_project_save(sender, instance, created: bool, update_fields: frozenset, **kwargs) -> None:
+    """
+    Receiver to discard the cached results of the utils when a project is created or its details are saved.
+
+    Args:
+        sender (Model): Project model.
+        instance (Project): Saved project.
+        created (bool): True if the project is created.
+        update_fields (frozenset): Fields passed to 'save', None when all the fields are saved.
+    """
+
+    if _are_utils_fields_saved(created, update_fields, todo_constants.UTILS_PROJECT_FIELDS):
+        common_cache.clear_cached_utils()
+
+
+@receiver(post_save, sender=project_models.ProjectMember)
+@receiver(post_delete, sender=get_user_model())
+@receiver(post_delete, sender=todo_models.Todo)
+@receiver(post_delete, sender=project_models.Project)
+@receiver(post_delete, sender=project_models.ProjectMember)
+def clear_cached_utils(sender, **kwargs) -> None:
+    """
+    Receiver to discard the cached results of the utils when a row read by them is deleted or a member is added.
+
+    Args:
+        sender (Model): Model class of the saved or deleted instance.
+    """
+
+    common_cache.clear_cached_utils()
@@ -1,54 +1,141 @@
-import json
+import itertools
+from collections.abc import Iterator
 
 from django.contrib.auth import get_user_model
 from django.contrib.postgres.aggregates.general import ArrayAgg
-from django.db.models import Case, CharField, Count, IntegerField, Prefetch, Sum, Q, When
-
-from projects import (
-    models as project_models,
-    serializers as project_serializers,
+from django.db.models import (
+    BooleanField,
+    Case,
+    CharField,
+    Count,
+    ExpressionWrapper,
+    F,
+    Func,
+    JSONField,
+    Q,
+    TextField,
+    Value,
+    When,
 )
+from django.db.models.functions import Cast
+
+from commons import cache as common_cache
+from projects import models as project_models
 from todos import (
+    constants as todo_constants,
     models as todo_models,
-    serializers as todo_serializers,
 )
-from users import serializers as user_serializers
 
+User = get_user_model()
+
+# Query expressions shared by the utils, built once as they are only read while compiling a query.
+COMPLETED_Q = Q(todo__done=True)
+PENDING_Q = Q(todo__done=False)
+PENDING_TODO_COUNT_ANNOTATION = {'pending_count': Count('todo', filter=PENDING_Q)}
+# Annotations are selected in the order they are defined, hence pending count comes before completed count.
+USER_TODO_COUNT_ANNOTATIONS = {
+    **PENDING_TODO_COUNT_ANNOTATION,
+    'completed_count': Count('todo', filter=COMPLETED_Q),
+}
+PROJECT_MEMBER_TODO_COUNT_ANNOTATIONS = {
+    'completed_count': Count('members__todo', filter=Q(members__todo__done=True)),
+    'pending_count': Count('members__todo', filter=Q(members__todo__done=False)),
+}
+USER_PROJECT_STATUS_ANNOTATIONS = {
+    'to_do_projects': ArrayAgg(
+        'projectmember__project__name',
+        filter=Q(projectmember__project__status=project_models.Project.TO_BE_STARTED),
+        default=Value([]),
+    ),
+    'in_progress_projects': ArrayAgg(
+        'projectmember__project__name',
+        filter=Q(projectmember__project__status=project_models.Project.IN_PROGRESS),
+        default=Value([]),
+    ),
+    'completed_projects': ArrayAgg(
+        'projectmember__project__name',
+        filter=Q(projectmember__project__status=project_models.Project.COMPLETED),
+        default=Value([]),
+    ),
+}
+
+
+def build_json_object(as_text: bool = False, **fields) -> Func:
+    """
+    Util to build a JSON object in Postgres.
+    JSON_BUILD_OBJECT is used instead of JSONB_BUILD_OBJECT used by JSONObject, as jsonb does not keep the key order.
+    psycopg2 decodes json values itself while JSONField expects a string, hence the outermost object is selected
+    as text and decoded by JSONField.
+
+    Args:
+        as_text (bool): True if the object is selected as text, False if it is nested in another object.
+        **fields: Key of the JSON object mapped to a field name or an expression for its value.
 
-def fetch_all_users() -> list[dict]:
+    Returns:
+        Func: JSON_BUILD_OBJECT expression.
+    """
+
+    return Func(
+        *itertools.chain.from_iterable(
+            (Cast(Value(key), output_field=TextField()), value) for key, value in fields.items()
+        ),
+        function='JSON_BUILD_OBJECT',
+        template='%(function)s(%(expressions)s)::text' if as_text else '%(function)s(%(expressions)s)',
+        output_field=JSONField(),
+    )
+
+
+def fetch_all_users(
+    offset: int = todo_constants.DEFAULT_OFFSET, limit: int = todo_constants.DEFAULT_LIMIT
+) -> list[dict]:
     """
     Util to fetch all the users.
 
+    Args:
+        offset (int): Number of rows to skip.
+        limit (int): Maximum number of rows to fetch.
+
     Returns:
         list[dict]: Contains user's id, first_name, last_name and email in each element.
             [
                 {
-                    "id": 1,
                     "first_name": "John",
                     "last_name": "Doe",
                     "email": "john@example.com",
+                    "id": 1,
                 },
             ]
     """
     
     # SQL Query:
-    # SELECT id, first_name, last_name, email FROM users_customuser;
+    # SELECT id, first_name, last_name, email FROM users_customuser ORDER BY id LIMIT <limit> OFFSET <offset>;
     
     # SQL Query used by Posgtres:
     # SELECT "users_customuser"."id", "users_customuser"."first_name", "users_customuser"."last_name", "users_customuser"."email" FROM "users_customuser"
+    # ORDER BY "users_customuser"."id" ASC LIMIT <limit> OFFSET <offset>
     
-    users_qs = get_user_model().objects.values('id', 'first_name', 'last_name', 'email')
+    users_qs = (
+        User.objects
+        .values('first_name', 'last_name', 'email', 'id')
+        .order_by('id')[offset:offset + limit]
+    )
     
-    return json.loads(json.dumps(user_serializers.UserSerializer(users_qs, many=True).data))
+    return list(users_qs)
 
 
-def fetch_all_todo_list_with_user_details() -> list[dict]:
+def fetch_all_todo_list_with_user_details(
+    offset: int = todo_constants.DEFAULT_OFFSET, limit: int = todo_constants.DEFAULT_LIMIT
+) -> Iterator[dict]:
     """
     Util to fetch all todos along with user details.
     Status is "Done" when done=True else "To do".
 
-    Returns:
-        list[dict]: Contains todo's id, name, status, created_at and creator.
+    Args:
+        offset (int): Number of rows to skip.
+        limit (int): Maximum number of rows to fetch.
+
+    Yields:
+        dict: Contains todo's id, name, status, created_at and creator.
             [
                 {
                     "id": 1,
@@ -65,40 +152,86 @@ def fetch_all_todo_list_with_user_details() -> list[dict]:
     
     # SQL Query:
     # SELECT
-    #   todo.id, todo.user_id, todo.name, todo.done, todo.date_created,
-    #   user.id, user.first_name, user.last_name, user.email
+    #   JSONB_BUILD_OBJECT(
+    #     'id', todo.id,
+    #     'name', todo.name,
+    #     'status', CASE WHEN todo.done THEN 'Done' ELSE 'To Do' END,
+    #     'created_at', TO_CHAR(todo.date_created, 'HH24:MI AM, DD Mon, YYYY'),
+    #     'creator', JSONB_BUILD_OBJECT('first_name', user.first_name, 'last_name', user.last_name, 'email', user.email)
+    #   )
     # FROM todos_todo AS todo
-    # INNER JOIN users_customuser AS user ON (todo.user_id = user.id);
+    # INNER JOIN users_customuser AS user ON (todo.user_id = user.id)
+    # ORDER BY todo.id LIMIT <limit> OFFSET <offset>;
     
     # SQL Query used by Postgres:
     # SELECT
-    #   "todos_todo"."id", "todos_todo"."user_id", "todos_todo"."name", "todos_todo"."done", "todos_todo"."date_created",
-    #   "users_customuser"."id", "users_customuser"."first_name", "users_customuser"."last_name", "users_customuser"."email"
+    #   JSON_BUILD_OBJECT(
+    #     ('id')::text, "todos_todo"."id",
+    #     ('name')::text, "todos_todo"."name",
+    #     ('status')::text, CASE WHEN "todos_todo"."done" THEN 'Done' ELSE 'To Do' END,
+    #     ('created_at')::text, TO_CHAR("todos_todo"."date_created", 'HH24:MI AM, DD Mon, YYYY'),
+    #     ('creator')::text, JSON_BUILD_OBJECT(
+    #       ('first_name')::text, "users_customuser"."first_name",
+    #       ('last_name')::text, "users_customuser"."last_name",
+    #       ('email')::text, "users_customuser"."email"
+    #     )
+    #   )::text AS "todo"
     # FROM "todos_todo"
     # INNER JOIN "users_customuser" ON ("todos_todo"."user_id" = "users_customuser"."id")
+    # ORDER BY "todos_todo"."id" ASC LIMIT <limit> OFFSET <offset>
     
+    # Each todo is built as a JSON object by the database.
     todos_qs = (
         todo_models.Todo.objects
-        .select_related('user')
-        .only('id', 'name', 'done', 'date_created', 'user__first_name', 'user__last_name', 'user__email')
+        .annotate(
+            todo=build_json_object(
+                as_text=True,
+                id='id',
+                name='name',
+                status=Case(
+                    When(done=True, then=Value(todo_constants.DONE_STATUS)),
+                    default=Value(todo_constants.TODO_STATUS),
+                ),
+                created_at=Func(
+                    'date_created',
+                    Value(todo_constants.POSTGRES_DATE_TIME_FORMAT),
+                    function='TO_CHAR',
+                    output_field=CharField(),
+                ),
+                creator=build_json_object(
+                    first_name='user__first_name',
+                    last_name='user__last_name',
+                    email='user__email',
+                ),
+            )
+        )
+        .values_list('todo', flat=True)
+        .order_by('id')[offset:offset + limit]
     )
     
-    return json.loads(json.dumps(todo_serializers.TodoSerializer(todos_qs, many=True).data))
+    # Rows are streamed in chunks using a server side cursor instead of loading all of them in memory.
+    yield from todos_qs.iterator(chunk_size=todo_constants.ITERATOR_CHUNK_SIZE)
 
 
-def fetch_projects_details() -> list[dict]:
+def fetch_projects_details(
+    offset: int = todo_constants.DEFAULT_OFFSET, limit: int = todo_constants.DEFAULT_LIMIT
+) -> list[dict]:
     """
     Util to fetch all projects.
 
+    Args:
+        offset (int): Number of rows to skip.
+        limit (int): Maximum number of rows to fetch.
+
     Returns:
         list[dict]: Contains project's id, name, status, existing_member_count and max_members.
             [
                 {
+                    "max_members": 4,
                     "id": 1,
                     "name": "Project A",
                     "status": "To Do",
                     "existing_member_count": 2,
-                    "max_members": 4,
                 },
             ]
     """
@@ -112,30 +245,40 @@ def fetch_projects_details() -> list[dict]:
     #   COUNT("projects_projectmember"."id") AS "existing_member_count"
     # FROM "projects_project"
     # LEFT OUTER JOIN "projects_projectmember" ON ("projects_project"."id" = "projects_projectmember"."project_id") GROUP BY "projects_project"."id"
+    # ORDER BY "projects_project"."id" ASC LIMIT <limit> OFFSET <offset>
     
     projects_qs = (
         project_models.Project.objects
         .annotate(existing_member_count=Count('projectmember__id'))
-        .only('id', 'name', 'status', 'max_members')
+        .values('max_members', 'id', 'name', 'status', 'existing_member_count')
+        .order_by('id')[offset:offset + limit]
     )
+    status_display = dict(project_models.Project.STATUS_CHOICES)
     
-    return json.loads(json.dumps(project_serializers.ProjectSerializer(projects_qs, many=True).data))
+    return [{**project, 'status': status_display[project['status']]} for project in projects_qs]
 
 
-def fetch_users_todo_stats() -> list[dict]:
+@common_cache.cached_util
+def fetch_users_todo_stats(
+    offset: int = todo_constants.DEFAULT_OFFSET, limit: int = todo_constants.DEFAULT_LIMIT
+) -> list[dict]:
     """
     Util to fetch todos list stats of all users on platform.
 
+    Args:
+        offset (int): Number of rows to skip.
+        limit (int): Maximum number of rows to fetch.
+
     Returns:
         list[dict]: Contains user's id, first_name, last_name, email, count of completed and pending todos.
             [
                 {
-                    "id": 1,
                     "first_name": "John",
                     "last_name": "Doe",
                     "email": "john@email.com",
-                    "completed_count": 1,
+                    "id": 1,
                     "pending_count": 2,
+                    "completed_count": 1,
                 },
             ]
     """
@@ -146,22 +289,21 @@ def fetch_users_todo_stats() -> list[dict]:
     #   "users_customuser"."first_name",
     #   "users_customuser"."last_name",
     #   "users_customuser"."email",
-    #   COUNT(CASE WHEN "todos_todo"."done" THEN 1 ELSE NULL END) AS "completed_count",
-    #   COUNT(CASE WHEN NOT "todos_todo"."done" THEN 1 ELSE NULL END) AS "pending_count"
+    #   COUNT("todos_todo"."id") FILTER (WHERE "todos_todo"."done") AS "completed_count",
+    #   COUNT("todos_todo"."id") FILTER (WHERE NOT "todos_todo"."done") AS "pending_count"
     # FROM "users_customuser"
     # LEFT OUTER JOIN "todos_todo" ON ("users_customuser"."id" = "todos_todo"."user_id")
     # GROUP BY "users_customuser"."id"
+    # ORDER BY "users_customuser"."id" ASC LIMIT <limit> OFFSET <offset>
     
     users_qs = (
-        get_user_model().objects
-        .annotate(
-            completed_count=Count(Case(When(todo__done=True, then=1), output_field=IntegerField())),
-            pending_count=Count(Case(When(todo__done=False, then=1), output_field=IntegerField()))
-        )
-        .values('id', 'first_name', 'last_name', 'email', 'completed_count', 'pending_count')
+        User.objects
+        .annotate(**USER_TODO_COUNT_ANNOTATIONS)
+        .values('first_name', 'last_name', 'email', 'id', 'pending_count', 'completed_count')
+        .order_by('id')[offset:offset + limit]
     )
     
-    return json.loads(json.dumps(user_serializers.UserTodoStatsSerializer(users_qs, many=True).data))
+    return list(users_qs)
 
 
 def fetch_five_users_with_max_pending_todos() -> list[dict]:
@@ -172,11 +314,10 @@ def fetch_five_users_with_max_pending_todos() -> list[dict]:
         list[dict]: Contains user's id, first_name, last_name, email, count of pending todos.
             [
                 {
-                    "id": 1,
                     "first_name": "John",
                     "last_name": "Doe",
                     "email": "john@email.com",
-                    "completed_count": 1,
+                    "id": 1,
                     "pending_count": 2,
                 },
             ]
@@ -188,19 +329,19 @@ def fetch_five_users_with_max_pending_todos() -> list[dict]:
     #   "users_customuser"."first_name",
     #   "users_customuser"."last_name",
     #   "users_customuser"."email",
-    #   COUNT(CASE WHEN NOT "todos_todo"."done" THEN 1 ELSE NULL END) AS "pending_count"
+    #   COUNT("todos_todo"."id") FILTER (WHERE NOT "todos_todo"."done") AS "pending_count"
     # FROM "users_customuser"
     # LEFT OUTER JOIN "todos_todo" ON ("users_customuser"."id" = "todos_todo"."user_id")
     # GROUP BY "users_customuser"."id" ORDER BY 5 DESC LIMIT 5
     
     users_qs = (
-        get_user_model().objects
-        .annotate(pending_count=Count(Case(When(todo__done=False, then=1), output_field=IntegerField())))
-        .values('id', 'first_name', 'last_name', 'email', 'pending_count')
+        User.objects
+        .annotate(**PENDING_TODO_COUNT_ANNOTATION)
+        .values('first_name', 'last_name', 'email', 'id', 'pending_count')
         .order_by('-pending_count')[:5]
     )
 
-    return json.loads(json.dumps(user_serializers.UserPendingTodoSerializer(users_qs, many=True).data))
+    return list(users_qs)
 
 
 def fetch_users_with_n_pending_todos(n: int) -> list[dict]:
@@ -214,11 +355,10 @@ def fetch_users_with_n_pending_todos(n: int) -> list[dict]:
         list[dict]: Contains user's id, first_name, last_name, email, count of pending todos.
             [
                 {
-                    "id": 1,
                     "first_name": "John",
                     "last_name": "Doe",
                     "email": "john@email.com",
-                    "completed_count": 1,
+                    "id": 1,
                     "pending_count": 2,
                 },
             ]
@@ -230,22 +370,23 @@ def fetch_users_with_n_pending_todos(n: int) -> list[dict]:
     #   "users_customuser"."first_name",
     #   "users_customuser"."last_name",
     #   "users_customuser"."email",
-    #   SUM(CASE WHEN NOT "todos_todo"."done" THEN 1 ELSE NULL END) AS "pending_count"
+    #   COUNT("todos_todo"."id") FILTER (WHERE NOT "todos_todo"."done") AS "pending_count"
     # FROM "users_customuser"
     # LEFT OUTER JOIN "todos_todo" ON ("users_customuser"."id" = "todos_todo"."user_id")
     # GROUP BY "users_customuser"."id"
-    # HAVING SUM(CASE WHEN (NOT "todos_todo"."done") THEN 1 ELSE NULL END) = 13
+    # HAVING COUNT("todos_todo"."id") FILTER (WHERE NOT "todos_todo"."done") = 13
 
     users_qs = (
-        get_user_model().objects
-        .annotate(pending_count=Sum(Case(When(todo__done=False, then=1), output_field=IntegerField())))
-        .values('id', 'first_name', 'last_name', 'email', 'pending_count')
+        User.objects
+        .annotate(**PENDING_TODO_COUNT_ANNOTATION)
+        .values('first_name', 'last_name', 'email', 'id', 'pending_count')
         .filter(pending_count=n)
     )
 
-    return json.loads(json.dumps(user_serializers.UserPendingTodoSerializer(users_qs, many=True).data))   
+    return list(users_qs)
 
 
+@common_cache.cached_util
 def fetch_project_with_member_name_start_or_end_with_u() -> list[dict]:
     """
     Util to fetch project details having members who have name either starting with U or ending with U.
@@ -262,10 +403,10 @@ def fetch_project_with_member_name_start_or_end_with_u() -> list[dict]:
     """
     
     # SQL Query used by Postgres:
-    # SELECT DISTINCT 
-    #   "projects_project"."name",
-    #   "projects_project"."status",
-    #   "projects_project"."max_members"
+    # SELECT DISTINCT
+    #   "projects_project"."max_members",
+    #   "projects_project"."name" AS "project_name",
+    #   "projects_project"."status" = 2 AS "done"
     # FROM "projects_project"
     # INNER JOIN "projects_projectmember" ON ("projects_project"."id" = "projects_projectmember"."project_id")
     # INNER JOIN "users_customuser" ON ("projects_projectmember"."member_id" = "users_customuser"."id")
@@ -274,13 +415,18 @@ def fetch_project_with_member_name_start_or_end_with_u() -> list[dict]:
     projects_qs = (
         project_models.Project.objects
         .filter(Q(members__first_name__istartswith='U')|Q(members__last_name__iendswith='U'))
-        .values('name', 'status', 'max_members')
+        .values(
+            'max_members',
+            project_name=F('name'),
+            done=ExpressionWrapper(Q(status=project_models.Project.COMPLETED), output_field=BooleanField()),
+        )
         .distinct()
     )
 
-    return json.loads(json.dumps(project_serializers.ProjectDetailSerializer(projects_qs, many=True).data))
+    return list(projects_qs)
 
 
+@common_cache.cached_util
 def fetch_project_wise_report() -> list[dict]:
     """
     Util to fetch project wise todos pending & count per user.    
@@ -310,48 +456,64 @@ def fetch_project_wise_report() -> list[dict]:
             ]
     """
     
-    # SQL Queries used by Postgres
-    #
+    # SQL Query used by Postgres:
     # SELECT
-    #   "users_customuser"."id",
-    #   "users_customuser"."password",
-    #   "users_customuser"."last_login",
-    #   "users_customuser"."is_superuser",
+    #   "projects_project"."id",
+    #   "projects_project"."name",
+    #   "projects_projectmember"."member_id",
     #   "users_customuser"."first_name",
     #   "users_customuser"."last_name",
     #   "users_customuser"."email",
-    #   "users_customuser"."date_joined",
-    #   "users_customuser"."is_staff",
-    #   SUM(CASE WHEN "todos_todo"."done" THEN 1 ELSE NULL END) AS "completed_count",
-    #   SUM(CASE WHEN NOT "todos_todo"."done" THEN 1 ELSE NULL END) AS "pending_count"
-    # FROM "users_customuser"
-    # LEFT OUTER JOIN "todos_todo" ON ("users_customuser"."id" = "todos_todo"."user_id")
-    # GROUP BY "users_customuser"."id"
-    # ORDER BY "users_customuser"."first_name" ASC
-    #
-    # SELECT
-    #   "projects_project"."id", "projects_project"."name", "projects_project"."max_members", "projects_project"."status"
+    #   COUNT("todos_todo"."id") FILTER (WHERE "todos_todo"."done") AS "completed_count",
+    #   COUNT("todos_todo"."id") FILTER (WHERE NOT "todos_todo"."done") AS "pending_count"
     # FROM "projects_project"
+    # LEFT OUTER JOIN "projects_projectmember" ON ("projects_project"."id" = "projects_projectmember"."project_id")
+    # LEFT OUTER JOIN "users_customuser" ON ("projects_projectmember"."member_id" = "users_customuser"."id")
+    # LEFT OUTER JOIN "todos_todo" ON ("users_customuser"."id" = "todos_todo"."user_id")
+    # GROUP BY
+    #   "projects_project"."id",
+    #   "projects_projectmember"."member_id",
+    #   "users_customuser"."first_name",
+    #   "users_customuser"."last_name",
+    #   "users_customuser"."email"
+    # ORDER BY "projects_project"."id" ASC, "users_customuser"."first_name" ASC
 
-    users_qs = (
-        get_user_model().objects
-        .annotate(
-            completed_count=Sum(Case(When(todo__done=True, then=1), output_field=IntegerField())),
-            pending_count=Sum(Case(When(todo__done=False, then=1), output_field=IntegerField()))
-        )
-        .order_by('first_name')
-    )
-
-    projects_qs = (
-        project_models.Project.objects.prefetch_related(Prefetch('members', to_attr='report', queryset=users_qs))
+    # Single row per project member, a project without members has a single row with null member fields.
+    project_members_qs = (
+        project_models.Project.objects
+        .values('id', 'name', 'members__id', 'members__first_name', 'members__last_name', 'members__email')
+        .annotate(**PROJECT_MEMBER_TODO_COUNT_ANNOTATIONS)
+        .order_by('id', 'members__first_name')
     )
 
-    return json.loads(json.dumps(project_serializers.ProjectWiseReportSerializer(projects_qs, many=True).data))
-
-def fetch_user_wise_project_status() -> list[dict]:
+    projects = {}
+    for project_member in project_members_qs:
+        report = projects.setdefault(
+            project_member['id'], {'project_title': project_member['name'], 'report': []}
+        )['report']
+        if project_member['members__id'] is not None:
+            report.append({
+                'first_name': project_member['members__first_name'],
+                'last_name': project_member['members__last_name'],
+                'email': project_member['members__email'],
+                'completed_count': project_member['completed_count'],
+                'pending_count': project_member['pending_count'],
+            })
+
+    return list(projects.values())
+
+
+@common_cache.cached_util
+def fetch_user_wise_project_status(
+    offset: int = todo_constants.DEFAULT_OFFSET, limit: int = todo_constants.DEFAULT_LIMIT
+) -> list[dict]:
     """
     Util to fetch user wise project statuses.
 
+    Args:
+        offset (int): Number of rows to skip.
+        limit (int): Maximum number of rows to fetch.
+
     Returns:
         list[dict]: List of user project data.
             [
@@ -370,46 +532,20 @@ def fetch_user_wise_project_status() -> list[dict]:
     #   "users_customuser"."first_name",
     #   "users_customuser"."last_name",
     #   "users_customuser"."email",
-    #   ARRAY_AGG(CASE WHEN "projects_project"."status" = 0 THEN "projects_project"."name" ELSE NULL END ) AS "to_do_projects",
-    #   ARRAY_AGG(CASE WHEN "projects_project"."status" = 1 THEN "projects_project"."name" ELSE NULL END ) AS "in_progress_projects",
-    #   ARRAY_AGG(CASE WHEN "projects_project"."status" = 2 THEN "projects_project"."name" ELSE NULL END ) AS "completed_projects"
+    #   COALESCE(ARRAY_AGG("projects_project"."name") FILTER (WHERE "projects_project"."status" = 0), '{}') AS "to_do_projects",
+    #   COALESCE(ARRAY_AGG("projects_project"."name") FILTER (WHERE "projects_project"."status" = 1), '{}') AS "in_progress_projects",
+    #   COALESCE(ARRAY_AGG("projects_project"."name") FILTER (WHERE "projects_project"."status" = 2), '{}') AS "completed_projects"
     # FROM "users_customuser"
     # LEFT OUTER JOIN "projects_projectmember" ON ("users_customuser"."id" = "projects_projectmember"."member_id")
     # LEFT OUTER JOIN "projects_project" ON ("projects_projectmember"."project_id" = "projects_project"."id")
     # GROUP BY "users_customuser"."id"
+    # ORDER BY "users_customuser"."id" ASC LIMIT <limit> OFFSET <offset>
 
     users_qs = (
-        get_user_model().objects
-        .annotate(
-            to_do_projects=ArrayAgg(
-                Case(
-                    When(
-                        projectmember__project__status=project_models.Project.TO_BE_STARTED,
-                        then='projectmember__project__name'
-                    ),
-                    output_field=CharField()
-                ),
-            ),
-            in_progress_projects=ArrayAgg(
-                Case(
-                    When(
-                        projectmember__project__status=project_models.Project.IN_PROGRESS,
-                        then='projectmember__project__name'
-                    ),
-                    output_field=CharField()
-                ),  
-            ),
-            completed_projects=ArrayAgg(
-                Case(
-                    When(
-                        projectmember__project__status=project_models.Project.COMPLETED,
-                        then='projectmember__project__name'
-                    ),
-                    output_field=CharField()
-                ),
-            )
-        )
+        User.objects
+        .annotate(**USER_PROJECT_STATUS_ANNOTATIONS)
         .values('first_name', 'last_name', 'email', 'to_do_projects', 'in_progress_projects', 'completed_projects')
+        .order_by('id')[offset:offset + limit]
     )
 
-    return json.loads(json.dumps(user_serializers.UserWiseProjectSerializer(users_qs, many=True).data))
+    return list(users_qs)
@@ -16,6 +16,8 @@ class TodoAPIViewSet(common_mixins.SerializerToActionMapperMixin, ModelViewSet):
     """
 
     pagination_class = common_pagination.CustomPagination
+    # Used for actions which are not mapped, like 'metadata' for OPTIONS requests.
+    serializer_class = todo_serializers.UpdateTodoSerializer
     serializer_classes = {
         'create': todo_serializers.CreateTodoSerializer,
         'list': todo_serializers.UpdateTodoSerializer,
@@ -40,4 +42,9 @@ class TodoAPIViewSet(common_mixins.SerializerToActionMapperMixin, ModelViewSet):
         Method to get the queryset for the view set.
         """
 
-        return todo_models.Todo.objects.filter(user_id=self.request.user.id)
+        # Serializers of the view set do not access the user, hence only todo columns are selected.
+        return (
+            todo_models.Todo.objects
+            .filter(user_id=self.request.user.id)
+            .only('id', 'name', 'done', 'date_created', 'date_completed')
+        )
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     name = 'users'
     verbose_name = 'Users Application'
+
+    def ready(self) -> None:
+        """
+        Method to connect the signal receivers of the app.
+        """
+
+        from users import signals  # noqa: F401
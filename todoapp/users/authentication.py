@@ -0,0 +1,76 @@
+import copy
+import functools
+import time
+
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions as rest_exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from users import constants as user_constants
+
+
+@functools.lru_cache(maxsize=user_constants.LOCAL_TOKEN_CACHE_MAX_SIZE)
+def get_cached_credentials(key: str, ttl_bucket: int) -> tuple:
+    """
+    Function to get the user and token of the token key, from the shared cache when present.
+    Results are cached in process per 'ttl_bucket', which changes every 'LOCAL_TOKEN_CACHE_TIMEOUT' seconds.
+    Password hash of the user is not fetched, so that it is not stored in the caches.
+
+    Args:
+        key (str): Token key.
+        ttl_bucket (int): Current time bucket of the in process cache.
+
+    Raises:
+        AuthenticationFailed: When the token is invalid or the user is inactive.
+
+    Returns:
+        tuple: User and token.
+    """
+
+    cache_key = user_constants.TOKEN_CACHE_KEY.format(key=key)
+    credentials = cache.get(cache_key)
+    if credentials is None:
+        try:
+            token = Token.objects.select_related('user').defer('user__password').get(key=key)
+        except Token.DoesNotExist:
+            raise rest_exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise rest_exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        credentials = (token.user, token)
+        cache.set(cache_key, credentials, timeout=user_constants.TOKEN_CACHE_TIMEOUT)
+
+    return credentials
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication which caches the user and token of a valid token key, in process and in the shared cache.
+    Cached credentials are discarded when the token or its user is saved or deleted. QuerySet 'update' sends no
+    signals, hence tokens and users changed by it remain cached till 'TOKEN_CACHE_TIMEOUT'.
+    Used only with a cache shared by all the processes, see 'REST_FRAMEWORK' settings.
+    """
+
+    def authenticate_credentials(self, key: str) -> tuple:
+        """
+        Method to get the user and token of the token key, from the cache when present.
+
+        Args:
+            key (str): Token key.
+
+        Raises:
+            AuthenticationFailed: When the token is invalid or the user is inactive.
+
+        Returns:
+            tuple: User and token.
+        """
+
+        user, token = get_cached_credentials(
+            key, int(time.monotonic() // user_constants.LOCAL_TOKEN_CACHE_TIMEOUT)
+        )
+
+        # Cached user is shared by the requests of the process, hence each request gets its own copy.
+        return copy.copy(user), token
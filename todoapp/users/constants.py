@@ -1,4 +1,20 @@
 ERROR_MESSAGES = {
+    'EMAIL_ALREADY_EXISTS': 'A user with this email already exists.',
+    'EMAILS_ALREADY_EXIST': 'Users with these emails already exist: {emails}.',
+    'DUPLICATE_EMAILS': 'Each user must have a different email, repeated emails: {emails}.',
     'INVALID_CREDENTIALS': 'Invalid credentials.',
     'PASSWORD_MISMATCH': 'The provided passwords do not match with each other.',   
 }
+
+# Cache of authenticated users and tokens by token key.
+TOKEN_CACHE_KEY = 'token:{key}'
+TOKEN_CACHE_TIMEOUT = 300
+# In process cache of the same, in front of the shared cache. Deleted tokens are discarded from the shared cache,
+# hence they remain valid in each process for at most the local timeout.
+LOCAL_TOKEN_CACHE_TIMEOUT = 5
+LOCAL_TOKEN_CACHE_MAX_SIZE = 4096
+
+# Argon2id parameters, memory cost is in KiB.
+ARGON2_TIME_COST = 3
+ARGON2_MEMORY_COST = 46 * 1024
+ARGON2_PARALLELISM = 1
@@ -0,0 +1,14 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+from users import constants as user_constants
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id password hasher using the OWASP recommended parameters (46 MiB memory, 3 iterations).
+    Hashes created with other parameters are updated on the next login of the user.
+    """
+
+    time_cost = user_constants.ARGON2_TIME_COST
+    memory_cost = user_constants.ARGON2_MEMORY_COST
+    parallelism = user_constants.ARGON2_PARALLELISM
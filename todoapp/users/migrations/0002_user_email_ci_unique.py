@@ -0,0 +1,52 @@
+# Generated by Django 5.0.4 on 2026-10-15 08:16
+
+import django.db.models.functions.text
+from django.db import IntegrityError, migrations, models
+
+
+def lower_case_emails(apps, schema_editor):
+    """
+    Function to lower case the emails of existing users.
+    Emails differing only in case would violate the unique email index once lower cased, hence they are
+    reported to be resolved by hand before migrating.
+    """
+
+    CustomUser = apps.get_model('users', 'CustomUser')
+    colliding_emails = (
+        CustomUser.objects
+        .alias(email_lower=django.db.models.functions.text.Lower('email'))
+        .filter(
+            email_lower__in=(
+                CustomUser.objects
+                .values(email_lower=django.db.models.functions.text.Lower('email'))
+                .annotate(count=models.Count('id'))
+                .filter(count__gt=1)
+                .values('email_lower')
+            )
+        )
+        .order_by('email_lower', 'email')
+        .values_list('email', flat=True)
+    )
+    if colliding_emails:
+        raise IntegrityError(
+            'Emails of these users differ only in case, change them before migrating: '
+            + ', '.join(colliding_emails)
+        )
+
+    CustomUser.objects.update(email=django.db.models.functions.text.Lower('email'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(lower_case_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='user_email_ci_unique'),
+        ),
+    ]
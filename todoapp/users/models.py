@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.db import models
+from django.db.models.functions import Lower
 
 from commons import constants as common_constants
 
@@ -29,6 +30,46 @@ class UserManager(BaseUserManager):
 
         return user
     
+    def filter_by_email(self, email: str) -> models.QuerySet:
+        """
+        Function to filter users by email, ignoring case.
+        Lookup is done on the lower cased email which uses the 'user_email_ci_unique' index.
+
+        Args:
+            email (str): Email address of the user.
+
+        Returns:
+            QuerySet: Users having the email.
+        """
+
+        return self.alias(email_lower=Lower('email')).filter(email_lower=email.lower())
+
+    def filter_by_emails(self, emails: list) -> models.QuerySet:
+        """
+        Function to filter users having any of the emails, ignoring case.
+
+        Args:
+            emails (list): Email addresses of the users.
+
+        Returns:
+            QuerySet: Users having any of the emails.
+        """
+
+        return self.alias(email_lower=Lower('email')).filter(email_lower__in=[email.lower() for email in emails])
+
+    def get_by_natural_key(self, email: str):
+        """
+        Function to get user by email, ignoring case. Used by the authentication backend.
+
+        Args:
+            email (str): Email address of the user.
+
+        Returns:
+            CustomUser: User having the email.
+        """
+
+        return self.filter_by_email(email).get()
+
     def create_superuser(self, email: str, password: str, **other_fields):
         """
         Function to create superuser in database.
@@ -57,7 +98,7 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     Fields:
         first_name (Max length is 150)
         last_name (Max length is 150)
-        email (Unique)
+        email (Unique, case insensitive)
         password (Inherited from AbstractBaseUser. Password is encrypted before saving.)
         date_joined (Default value is the time of User object creation)
         last_login (Inherited from AbstractBaseUser)
@@ -74,7 +115,25 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     objects = UserManager()
     
     USERNAME_FIELD = 'email'
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(Lower('email'), name='user_email_ci_unique'),
+        ]
     
+    def save(self, *args, **kwargs) -> None:
+        """
+        Function to save the user.
+        Emails are stored in lower case, whichever path the user is saved from.
+        Email is not read when it is not saved, e.g. 'password' saved for a user fetched with deferred fields.
+        """
+
+        update_fields = kwargs.get('update_fields')
+        # Deferred fields are not saved when 'update_fields' is not given.
+        if 'email' not in self.get_deferred_fields() and (update_fields is None or 'email' in update_fields):
+            self.email = self.email.lower()
+        super().save(*args, **kwargs)
+
     def get_short_name(self) -> str:
         """
         Function to get short name of the user.
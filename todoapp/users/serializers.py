@@ -1,14 +1,26 @@
-from collections import OrderedDict
+import collections
+import hmac
 
-from django.contrib.auth import authenticate, hashers, get_user_model
+from django.contrib.auth import get_user_model
+from django.db import transaction
 from rest_framework import (
     serializers as rest_serializers,
     exceptions as rest_exceptions,
 )
 from rest_framework.authtoken.models import Token
 
+from commons import (
+    cache as common_cache,
+    mixins as common_mixins,
+)
 from users import constants as user_constants
 
+User = get_user_model()
+
+# Error details built once, DRF copies them into new error detail objects when raising.
+PASSWORD_MISMATCH_ERROR_DETAIL = {'password': [user_constants.ERROR_MESSAGES['PASSWORD_MISMATCH']]}
+INVALID_CREDENTIALS_ERROR_DETAIL = {'error': [user_constants.ERROR_MESSAGES['INVALID_CREDENTIALS']]}
+
 
 class BaseUserSerializer(rest_serializers.ModelSerializer):
     """
@@ -16,197 +28,219 @@ class BaseUserSerializer(rest_serializers.ModelSerializer):
     """
 
     class Meta:
-        model = get_user_model()
+        model = User
         fields = ('first_name', 'last_name', 'email')
 
 
-class RegisterUserSerializer(BaseUserSerializer):
+class RegisterUserListSerializer(rest_serializers.ListSerializer):
     """
-    Register user API serializer.
+    Register users serializer for creating multiple users.
     """
 
-    confirm_password = rest_serializers.CharField(write_only=True, trim_whitespace=False)
-    token = rest_serializers.SerializerMethodField()
-
-    def get_token(self, obj) -> str:
-        """
-        Method to populate token field.
-
-        Args:
-            obj (CustomUser): CustomUser model instance.
-
-        Returns:
-            str: User token.
+    def validate(self, attrs: list) -> list:
         """
-
-        return Token.objects.create(user=obj).key
-
-    def validate(self, attrs: OrderedDict) -> OrderedDict:
-        """
-        Method to validate request data.
-        Checks whether 'password' and 'confirm_password' are equal or not.
+        Method to validate the emails of all the users together.
+        Checks for emails repeated in the request data and emails of existing users with a single query.
 
         Args:
-            attrs (OrderedDict): Request data.
+            attrs (list): Validated request data of each user.
 
         Raises:
-            ValidationError: When 'password' and 'confirm_password' are not equal.
+            ValidationError: When an email is repeated or a user with the email already exists.
 
         Returns:
-            OrderedDict: Request data.
+            list: Validated request data of each user.
         """
-    
-        if attrs['password'] != attrs['confirm_password']:
-            raise rest_exceptions.ValidationError({'password': [user_constants.ERROR_MESSAGES['PASSWORD_MISMATCH']]})
-        attrs.update({'password': hashers.make_password(attrs['password'])})
-        attrs.pop('confirm_password')
 
-        return attrs
-
-    class Meta(BaseUserSerializer.Meta):
-        fields = BaseUserSerializer.Meta.fields + ('date_joined', 'password', 'confirm_password', 'token')
-        extra_kwargs = {'password': {'write_only': True, 'trim_whitespace': False}}
+        # Emails are lower cased by 'RegisterUserSerializer.validate_email'.
+        emails = [user_attrs['email'] for user_attrs in attrs]
 
+        duplicate_emails = sorted(email for email, count in collections.Counter(emails).items() if count > 1)
+        if duplicate_emails:
+            raise rest_exceptions.ValidationError(
+                user_constants.ERROR_MESSAGES['DUPLICATE_EMAILS'].format(emails=', '.join(duplicate_emails))
+            )
 
-class LoginUserSerializer(rest_serializers.Serializer):
-    """
-    Login user API serializer.
-    """
+        existing_emails = sorted(User.objects.filter_by_emails(emails).values_list('email', flat=True))
+        if existing_emails:
+            raise rest_exceptions.ValidationError(
+                user_constants.ERROR_MESSAGES['EMAILS_ALREADY_EXIST'].format(emails=', '.join(existing_emails))
+            )
 
-    email = rest_serializers.EmailField(write_only=True)
-    password = rest_serializers.CharField(write_only=True, trim_whitespace=False)
-    auth_token = rest_serializers.SerializerMethodField()
+        return attrs
 
-    def get_auth_token(self, obj) -> str:
+    @staticmethod
+    def create_users(validated_data: list) -> list:
         """
-        Method to populate auth_token field.
+        Method to create the users along with their tokens.
+        Users and tokens are inserted with a single query each, in a single transaction.
+        Users are bulk created, hence model signals are not sent for them and the cached utils are discarded here.
 
         Args:
-            obj (OrderedDict): Request data.
+            validated_data (list): Validated request data of each user.
 
         Returns:
-            str: Auth token
+            list: Created users.
         """
 
-        token, _ = Token.objects.get_or_create(user=self.user)
-        return token.key
+        users = []
+        for attrs in validated_data:
+            user = User(**attrs)
+            user.set_password(attrs['password'])
+            users.append(user)
+
+        # Users and their tokens are committed together in a single transaction.
+        with transaction.atomic():
+            users = User.objects.bulk_create(users)
+            tokens = Token.objects.bulk_create([Token(user=user, key=Token.generate_key()) for user in users])
+        for user, token in zip(users, tokens):
+            user._token_key = token.key
+        common_cache.clear_cached_utils()
 
-    def validate(self, attrs: OrderedDict) -> OrderedDict:
+        return users
+
+    def create(self, validated_data: list) -> list:
         """
-        Method to authenticate user.
-        If the credentials provided by the user are valid then populate the 'auth_token' field.
+        Method to create the users along with their tokens.
 
         Args:
-            attrs (OrderedDict): Request data.
-
-        Raises:
-            AuthenticationFailed: When the credentials provided by the user are incorrect.
+            validated_data (list): Validated request data of each user.
 
         Returns:
-            OrderedDict: Request data.
+            list: Created users.
         """
 
-        self.user = authenticate(username=attrs['email'], password=attrs['password'])
-        if not self.user:
-            raise rest_exceptions.AuthenticationFailed({'error': [user_constants.ERROR_MESSAGES['INVALID_CREDENTIALS']]})
-
-        return attrs
-
-    class Meta:
-        fields = ('email', 'password', 'auth_token')
+        return self.create_users(validated_data)
 
 
-class UserSerializer(BaseUserSerializer):
+class RegisterUserSerializer(common_mixins.CachedFieldsSerializerMixin, BaseUserSerializer):
     """
-    Base serializer for user model.
+    Register user API serializer.
     """
 
-    class Meta(BaseUserSerializer.Meta):
-        fields = BaseUserSerializer.Meta.fields + ('id',)
-
-
-class UserPendingTodoSerializer(UserSerializer):
-    """
-    User pending todo serializer.
-    """
+    confirm_password = rest_serializers.CharField(write_only=True, trim_whitespace=False)
+    token = rest_serializers.SerializerMethodField()
 
-    pending_count = rest_serializers.IntegerField()
+    def get_token(self, obj) -> str:
+        """
+        Method to populate token field.
 
-    class Meta(UserSerializer.Meta):
-        fields = UserSerializer.Meta.fields + ('pending_count',)
+        Args:
+            obj (CustomUser): CustomUser model instance.
 
+        Returns:
+            str: User token.
+        """
 
-class UserTodoStatsSerializer(UserPendingTodoSerializer):
-    """
-    User todo stats serializer.
-    """
+        return obj._token_key
 
-    completed_count = rest_serializers.IntegerField()
+    def create(self, validated_data: dict):
+        """
+        Method to create the user along with its token.
+        The password is hashed here, so that it is hashed only for a valid request which is saved.
+        The token key is stored on the instance so that 'token' field does not query the database.
 
-    class Meta(UserPendingTodoSerializer.Meta):
-        fields = UserPendingTodoSerializer.Meta.fields + ('completed_count',)
+        Args:
+            validated_data (dict): Validated request data.
 
+        Returns:
+            CustomUser: Created user.
+        """
 
-class UserWiseProjectSerializer(BaseUserSerializer):
-    """
-    User wise project stats serializer.
-    """
+        # Single user is created by the bulk path which skips the model signals and the save machinery.
+        user, = RegisterUserListSerializer.create_users([validated_data])
 
-    to_do_projects = rest_serializers.SerializerMethodField()
-    in_progress_projects = rest_serializers.SerializerMethodField()
-    completed_projects = rest_serializers.SerializerMethodField()
+        return user
 
-    def _remove_none_from_list(self, project_names: list) -> list:
+    def validate_email(self, email: str) -> str:
         """
-        Method to remove None values from a list.
+        Field level validation for 'email'.
+        Emails are stored in lower case, hence the uniqueness is checked ignoring case.
 
         Args:
-            project_names (list): Project names.
+            email (str): Email address of the user.
+
+        Raises:
+            ValidationError: When a user with the email already exists.
 
         Returns:
-            list: Project names whose value is not None.
+            str: Lower cased email address.
         """
 
-        return [project_name for project_name in project_names if project_name is not None]
+        email = email.lower()
+        # Emails of multiple users are checked together by 'RegisterUserListSerializer.validate'.
+        if not isinstance(self.parent, RegisterUserListSerializer) and User.objects.filter_by_email(email).exists():
+            raise rest_exceptions.ValidationError(user_constants.ERROR_MESSAGES['EMAIL_ALREADY_EXISTS'])
 
-    def get_to_do_projects(self, obj) -> list:
+        return email
+
+    def validate(self, attrs: dict) -> dict:
         """
-        Method to populate to_do_projects field.
+        Method to validate request data.
+        Checks whether 'password' and 'confirm_password' are equal or not.
 
         Args:
-            obj (CustomUser): CustomUser model instance.
+            attrs (dict): Request data.
+
+        Raises:
+            ValidationError: When 'password' and 'confirm_password' are not equal.
 
         Returns:
-            list: Project names which are yet to be started.
+            dict: Request data.
         """
-
-        return self._remove_none_from_list(obj['to_do_projects'])
     
-    def get_in_progress_projects(self, obj) -> list:
-        """
-        Method to populate in_progress_projects field.
+        # Passwords are compared in constant time, str is encoded as compare_digest accepts only ASCII str.
+        if not hmac.compare_digest(attrs['password'].encode(), attrs['confirm_password'].encode()):
+            raise rest_exceptions.ValidationError(PASSWORD_MISMATCH_ERROR_DETAIL)
+        attrs.pop('confirm_password')
 
-        Args:
-            obj (CustomUser): CustomUser model instance.
+        return attrs
 
-        Returns:
-            list: Project names which are in progress.
-        """
+    class Meta(BaseUserSerializer.Meta):
+        fields = BaseUserSerializer.Meta.fields + ('date_joined', 'password', 'confirm_password', 'token')
+        list_serializer_class = RegisterUserListSerializer
+        extra_kwargs = {
+            'password': {'write_only': True, 'trim_whitespace': False},
+            # Case sensitive unique validator of the model field is replaced by 'validate_email'.
+            'email': {'validators': []},
+        }
 
-        return self._remove_none_from_list(obj['in_progress_projects'])
-    
-    def get_completed_projects(self, obj) -> list:
+
+class LoginUserSerializer(rest_serializers.Serializer):
+    """
+    Login user API serializer.
+    """
+
+    email = rest_serializers.EmailField(write_only=True)
+    password = rest_serializers.CharField(write_only=True, trim_whitespace=False)
+
+    def validate(self, attrs: dict) -> dict:
         """
-        Method to populate completed_projects field.
+        Method to authenticate user.
+        If the credentials provided by the user are valid then store the auth token key in 'token_key'.
 
         Args:
-            obj (CustomUser): CustomUser model instance.
+            attrs (dict): Request data.
+
+        Raises:
+            AuthenticationFailed: When the credentials provided by the user are incorrect.
 
         Returns:
-            list: Project names which are completed.
+            dict: Request data.
         """
 
-        return self._remove_none_from_list(obj['completed_projects'])
+        # Only the columns required for checking the password and fetching the token are selected.
+        self.user = User.objects.filter_by_email(attrs['email']).only('id', 'password').first()
+        # Unknown emails are rejected without running the password hasher, emails of registered users are
+        # already exposed by the register API hence this does not leak anything new.
+        if not (self.user and self.user.check_password(attrs['password'])):
+            raise rest_exceptions.AuthenticationFailed(INVALID_CREDENTIALS_ERROR_DETAIL)
+
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.token_key = token.key
+
+        return attrs
+
+    class Meta:
+        fields = ('email', 'password')
 
-    class Meta(BaseUserSerializer.Meta):
-        fields = BaseUserSerializer.Meta.fields + ('to_do_projects', 'in_progress_projects', 'completed_projects')
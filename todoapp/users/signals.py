@@ -0,0 +1,50 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from commons import cache as common_cache
+from users import constants as user_constants
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def clear_cached_token(sender, instance: Token, **kwargs) -> None:
+    """
+    Receiver to discard the cached credentials of a saved or deleted token from the shared cache.
+    In process caches expire with their time bucket, see 'get_cached_credentials'.
+
+    Args:
+        sender (Model): Token model.
+        instance (Token): Saved or deleted token.
+    """
+
+    # Credentials are cached only in a shared cache, and a new token cannot have cached credentials,
+    # e.g. the one created on login.
+    if not common_cache.is_cache_shared() or kwargs.get('created'):
+        return
+
+    cache.delete(user_constants.TOKEN_CACHE_KEY.format(key=instance.key))
+
+
+@receiver(post_save, sender=get_user_model())
+def clear_cached_user_token(sender, instance, created: bool, **kwargs) -> None:
+    """
+    Receiver to discard the cached credentials of a saved user, so that the token authenticates the updated user.
+    Credentials of a deleted user are discarded by the deletion of its token.
+
+    Args:
+        sender (Model): User model.
+        instance (CustomUser): Saved user.
+        created (bool): True if the user is created.
+    """
+
+    # Credentials are cached only in a shared cache, and a new user cannot have cached credentials.
+    if not common_cache.is_cache_shared() or created:
+        return
+
+    cache.delete_many([
+        user_constants.TOKEN_CACHE_KEY.format(key=key)
+        for key in Token.objects.filter(user=instance).values_list('key', flat=True)
+    ])
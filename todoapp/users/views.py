@@ -45,4 +45,5 @@ class UserLoginAPIView(rest_generics.GenericAPIView):
         except rest_exceptions.AuthenticationFailed as error:
             return rest_response.Response(error.detail, error.status_code)
 
-        return rest_response.Response(serializer.data)
+        # Response contains only the token, hence it is built directly instead of serializing the request data.
+        return rest_response.Response({'auth_token': serializer.token_key})